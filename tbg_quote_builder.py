@@ -13,29 +13,213 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta
 import csv
+import functools
+import importlib.util
+import io
 import json
+import math
+import subprocess
+import sys
+import threading
+import warnings
 from pathlib import Path
 
-# PDF generation
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
-
-
 # TBG Brand Colors
-TBG_RED = HexColor("#C41E3A")
-TBG_BLACK = HexColor("#1A1A1A")
-TBG_GRAY = HexColor("#4A4A4A")
-TBG_LIGHT_GRAY = HexColor("#F5F5F5")
+# (hex strings, which reportlab and Tk both accept, so startup needn't import reportlab)
+TBG_RED = "#C41E3A"
+TBG_BLACK = "#1A1A1A"
+TBG_GRAY = "#4A4A4A"
+TBG_LIGHT_GRAY = "#F5F5F5"
 
 # Company Info
 COMPANY_ADDRESS = "4351 Latimer Cr, Burlington ON L7M 4R3"
 COMPANY_EMAIL = "Ted@TBGEnterprises.com"
 COMPANY_PHONE = "(416) 271-4341"
 
+# Reportlab table layout cost grows faster than linearly with row count,
+# so long scopes of work are split into several tables of this many rows
+PDF_TABLE_CHUNK_ROWS = 500
+
+# Write buffer for CSV/IIF exports, large enough to hold a whole quote
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# IIF files are written as bytes with the platform line ending text mode used
+IIF_NEWLINE = os.linesep.encode('ascii')
+IIF_HEADER = IIF_NEWLINE.join([
+    b"!TRNS\tTRNSTYPE\tDATE\tACCNT\tNAME\tCLASS\tAMOUNT\tDOCNUM\tMEMO",
+    b"!SPL\tTRNSTYPE\tDATE\tACCNT\tNAME\tAMOUNT\tDOCNUM\tMEMO\tQNTY\tPRICE",
+    b"!ENDTRNS",
+]) + IIF_NEWLINE
+
+# Parsed config files keyed by (path, mtime_ns)
+_config_cache = {}
+
+# reportlab measures text and encodes PDF streams in C when its rl_accel
+# extension is installed; find_spec checks without importing reportlab
+if importlib.util.find_spec("_rl_accel") is None:
+    warnings.warn("reportlab's C accelerator is not installed, so PDF generation will be slower. "
+                  "Install it with: pip install \"reportlab[accel]\"", RuntimeWarning)
+
+# Characters users type in rates ("$1,250.00") that float() rejects
+_RATE_STRIP = str.maketrans('', '', ',$ ')
+
+
+class PDFStyles:
+    """Styles and fixed table cells for PDF quotes, built by get_pdf_styles()"""
+    def __init__(self):
+        from reportlab.lib.enums import TA_LEFT, TA_RIGHT
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, TableStyle
+        
+        self.paragraph = getSampleStyleSheet()
+        
+        # Custom styles
+        self.paragraph.add(ParagraphStyle(
+            name='CompanyAddress',
+            parent=self.paragraph['Normal'],
+            fontSize=8,
+            textColor=TBG_GRAY,
+            alignment=TA_LEFT,
+            spaceAfter=0
+        ))
+        
+        self.paragraph.add(ParagraphStyle(
+            name='CompanyName',
+            parent=self.paragraph['Heading1'],
+            fontSize=24,
+            textColor=TBG_RED,
+            spaceAfter=2,
+            alignment=TA_LEFT
+        ))
+        
+        self.paragraph.add(ParagraphStyle(
+            name='QuoteTitle',
+            parent=self.paragraph['Heading2'],
+            fontSize=18,
+            textColor=TBG_BLACK,
+            spaceAfter=20,
+            alignment=TA_LEFT
+        ))
+        
+        self.paragraph.add(ParagraphStyle(
+            name='SectionHeader',
+            parent=self.paragraph['Heading3'],
+            fontSize=11,
+            textColor=TBG_RED,
+            spaceBefore=15,
+            spaceAfter=5,
+            fontName='Helvetica-Bold'
+        ))
+        
+        self.paragraph.add(ParagraphStyle(
+            name='TBGBody',
+            parent=self.paragraph['Normal'],
+            fontSize=10,
+            textColor=TBG_GRAY,
+            spaceAfter=3
+        ))
+        
+        self.paragraph.add(ParagraphStyle(
+            name='SmallText',
+            parent=self.paragraph['Normal'],
+            fontSize=8,
+            textColor=TBG_GRAY
+        ))
+        
+        self.paragraph.add(ParagraphStyle(
+            name='QuoteNumber',
+            parent=self.paragraph['Normal'],
+            fontSize=16,
+            textColor=TBG_BLACK,
+            alignment=TA_RIGHT
+        ))
+        
+        # Fixed header and label cells (Tables copy their rows, so sharing is safe)
+        small = self.paragraph['SmallText']
+        body = self.paragraph['TBGBody']
+        self.items_header_row = [Paragraph(f"<b>{label}</b>", small) for label in
+                                 ("Category", "Description", "Qty", "Unit", "Rate", "Amount")]
+        self.payment_header_row = [Paragraph(f"<b>{label}</b>", small) for label in
+                                   ("Payment", "When", "Amount")]
+        self.deposit_labels = [Paragraph("Deposit (20%)", small),
+                               Paragraph("Upon acceptance", small)]
+        self.signature_rows = [
+            [Paragraph("ACCEPTED BY:", body), "", 
+             Paragraph("TBG ENTERPRISES:", body), ""],
+            ["_" * 35, "", "_" * 35, ""],
+            [Paragraph("Customer Signature", small), 
+             Paragraph("Date", small),
+             Paragraph("Authorized Signature", small),
+             Paragraph("Date", small)],
+        ]
+        
+        # Column widths shared by the scope-of-work and totals tables
+        self.item_col_widths = (1*inch, 2.8*inch, 0.5*inch, 0.5*inch, 0.9*inch, 0.9*inch)
+        
+        self.header_table = TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ])
+        
+        self.separator_table = TableStyle([
+            ('LINEABOVE', (0, 0), (-1, 0), 3, TBG_RED),
+        ])
+        
+        self.info_table = TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ])
+        
+        self.items_table = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), TBG_BLACK),
+            ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
+            ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('TOPPADDING', (0, 0), (-1, 0), 8),
+            ('BACKGROUND', (0, 1), (-1, -1), 'white'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), ['white', TBG_LIGHT_GRAY]),
+            ('GRID', (0, 0), (-1, -1), 0.5, TBG_GRAY),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+            # Plain string Qty/Unit cells styled like the SmallText paragraphs
+            ('ALIGN', (2, 1), (3, -1), 'LEFT'),
+            ('FONTSIZE', (2, 1), (3, -1), 8),
+            ('TEXTCOLOR', (2, 1), (3, -1), TBG_GRAY),
+        ])
+        
+        self.totals_table = TableStyle([
+            ('ALIGN', (4, 0), (-1, -1), 'RIGHT'),
+            ('LINEABOVE', (4, 0), (-1, 0), 1, TBG_BLACK),
+        ])
+        
+        self.payment_table = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), TBG_BLACK),
+            ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
+            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, TBG_GRAY),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -2), ['white', TBG_LIGHT_GRAY]),
+            ('BACKGROUND', (0, -1), (-1, -1), TBG_LIGHT_GRAY),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            # Plain string weekly payment labels styled like SmallText
+            ('FONTSIZE', (0, 1), (1, -1), 8),
+            ('TEXTCOLOR', (0, 1), (1, -1), TBG_GRAY),
+        ])
+        
+        self.signature_table = TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
+            ('TOPPADDING', (0, 1), (-1, 1), 30),
+        ])
+
+
+@functools.lru_cache(maxsize=None)
+def get_pdf_styles():
+    """Shared PDF styles, built on first use so startup doesn't import reportlab"""
+    return PDFStyles()
+
 
 class TBGLogo:
     """TBG Logo as a Flowable for use in Platypus"""
@@ -46,9 +230,18 @@ class TBGLogo:
     def drawOn(self, canv, x, y, _sW=0):
         canv.saveState()
         canv.translate(x, y)
-        self.draw(canv)
+        self.draw_form(canv)
         canv.restoreState()
     
+    def draw_form(self, canv):
+        """Draw the logo, compiling it into a PDF form XObject on first use"""
+        name = f"tbg_logo_{self.width}x{self.height}"
+        if not canv.hasForm(name):
+            canv.beginForm(name, 0, 0, self.width, self.height)
+            self.draw(canv)
+            canv.endForm()
+        canv.doForm(name)
+    
     def wrap(self, availWidth, availHeight):
         return (self.width, self.height)
     
@@ -85,79 +278,6 @@ class TBGLogo:
         canv.drawCentredString(self.width/2, self.height - 50, "enterprises")
 
 
-class LineItemFrame(ttk.Frame):
-    """A single line item row"""
-    def __init__(self, parent, categories, on_delete, on_update):
-        super().__init__(parent)
-        self.on_delete = on_delete
-        self.on_update = on_update
-        
-        # Category dropdown
-        self.category_var = tk.StringVar()
-        self.category_combo = ttk.Combobox(self, textvariable=self.category_var, 
-                                           values=categories, width=15, state="readonly")
-        self.category_combo.grid(row=0, column=0, padx=2, pady=2)
-        self.category_combo.bind("<<ComboboxSelected>>", lambda e: self.on_update())
-        
-        # Description
-        self.desc_var = tk.StringVar()
-        self.desc_entry = ttk.Entry(self, textvariable=self.desc_var, width=35)
-        self.desc_entry.grid(row=0, column=1, padx=2, pady=2)
-        self.desc_entry.bind("<KeyRelease>", lambda e: self.on_update())
-        
-        # Quantity
-        self.qty_var = tk.StringVar(value="1")
-        self.qty_entry = ttk.Entry(self, textvariable=self.qty_var, width=8)
-        self.qty_entry.grid(row=0, column=2, padx=2, pady=2)
-        self.qty_entry.bind("<KeyRelease>", lambda e: self.on_update())
-        
-        # Unit
-        self.unit_var = tk.StringVar(value="ea")
-        self.unit_combo = ttk.Combobox(self, textvariable=self.unit_var,
-                                       values=["ea", "hr", "sq ft", "ln ft", "day", "lot"],
-                                       width=6, state="readonly")
-        self.unit_combo.grid(row=0, column=3, padx=2, pady=2)
-        
-        # Rate
-        self.rate_var = tk.StringVar(value="0.00")
-        self.rate_entry = ttk.Entry(self, textvariable=self.rate_var, width=10)
-        self.rate_entry.grid(row=0, column=4, padx=2, pady=2)
-        self.rate_entry.bind("<KeyRelease>", lambda e: self.on_update())
-        
-        # Amount (calculated)
-        self.amount_label = ttk.Label(self, text="$0.00", width=12, anchor="e")
-        self.amount_label.grid(row=0, column=5, padx=2, pady=2)
-        
-        # Delete button
-        self.delete_btn = ttk.Button(self, text="✕", width=3, command=self.delete_self)
-        self.delete_btn.grid(row=0, column=6, padx=2, pady=2)
-    
-    def delete_self(self):
-        self.on_delete(self)
-    
-    def get_amount(self):
-        try:
-            qty = float(self.qty_var.get() or 0)
-            rate = float(self.rate_var.get().replace(",", "") or 0)
-            return qty * rate
-        except ValueError:
-            return 0
-    
-    def update_amount_display(self):
-        amount = self.get_amount()
-        self.amount_label.config(text=f"${amount:,.2f}")
-    
-    def get_data(self):
-        return {
-            "category": self.category_var.get(),
-            "description": self.desc_var.get(),
-            "quantity": self.qty_var.get(),
-            "unit": self.unit_var.get(),
-            "rate": self.rate_var.get(),
-            "amount": self.get_amount()
-        }
-
-
 class TBGQuoteBuilder(tk.Tk):
     """Main application window"""
     
@@ -181,6 +301,18 @@ class TBGQuoteBuilder(tk.Tk):
         "Other"
     ]
     
+    UNITS = ("ea", "hr", "sq ft", "ln ft", "day", "lot")
+    
+    # Line item tree columns: (field, heading, width, anchor)
+    ITEM_COLUMNS = [
+        ("category", "Category", 130, "w"),
+        ("description", "Description", 300, "w"),
+        ("quantity", "Qty", 60, "e"),
+        ("unit", "Unit", 60, "w"),
+        ("rate", "Rate", 90, "e"),
+        ("amount", "Amount", 100, "e"),
+    ]
+    
     def __init__(self):
         super().__init__()
         
@@ -197,7 +329,9 @@ class TBGQuoteBuilder(tk.Tk):
         self.style.configure("Title.TLabel", font=("Helvetica", 18, "bold"), foreground="#C41E3A")
         self.style.configure("Total.TLabel", font=("Helvetica", 12, "bold"))
         
-        self.line_items = []
+        self.line_items = {}  # Row data dicts keyed by Treeview iid
+        self._editing = None  # (iid, field, original value) of the open cell editor
+        self._pending_update = None  # after() id of the queued totals recompute
         self.attachments = []  # List of file paths for attached plans/images
         self.quote_number = self.generate_quote_number()
         
@@ -215,13 +349,21 @@ class TBGQuoteBuilder(tk.Tk):
         """Load categories from config file, or use defaults"""
         config_path = self.get_config_path()
         try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    return config.get('categories', self.DEFAULT_CATEGORIES.copy())
-        except:
-            pass
-        return self.DEFAULT_CATEGORIES.copy()
+            key = (config_path, os.stat(config_path).st_mtime_ns)
+            config = _config_cache.get(key)
+            if config is None:
+                with open(config_path, 'rb') as f:
+                    config = json.loads(f.read())
+                _config_cache[key] = config
+        except (OSError, ValueError):
+            # Missing, unreadable, or malformed config (JSONDecodeError is a ValueError)
+            return self.DEFAULT_CATEGORIES.copy()
+        
+        # Valid JSON of the wrong shape also falls back to the defaults
+        categories = config.get('categories') if isinstance(config, dict) else None
+        if not isinstance(categories, list) or not all(isinstance(c, str) for c in categories):
+            return self.DEFAULT_CATEGORIES.copy()
+        return list(categories)
     
     def save_categories(self):
         """Save categories to config file"""
@@ -230,13 +372,24 @@ class TBGQuoteBuilder(tk.Tk):
             config = {'categories': self.categories}
             with open(config_path, 'w') as f:
                 json.dump(config, f, indent=2)
+            # mtime resolution can be coarse, so don't trust older entries
+            _config_cache.clear()
         except Exception as e:
             messagebox.showerror("Error", f"Could not save categories: {str(e)}")
     
+    def run_in_background(self, work, on_done):
+        """Call work() on a worker thread, then on_done(result, error) on the Tk thread"""
+        def worker():
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self.after(0, lambda: on_done(result, error))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
     def check_for_updates(self):
         """Check GitHub for updates and install if available"""
-        import subprocess
-        
         # Get the app directory
         app_dir = os.path.dirname(os.path.abspath(__file__))
         
@@ -248,46 +401,57 @@ class TBGQuoteBuilder(tk.Tk):
                 "Updates must be downloaded manually.")
             return
         
-        try:
-            # Fetch from remote
-            subprocess.run(['git', 'fetch', 'origin', 'main'], 
-                          cwd=app_dir, capture_output=True, check=True)
-            
-            # Get local and remote commit hashes
-            local = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                   cwd=app_dir, capture_output=True, text=True)
-            remote = subprocess.run(['git', 'rev-parse', 'origin/main'], 
-                                    cwd=app_dir, capture_output=True, text=True)
-            
-            if local.stdout.strip() == remote.stdout.strip():
-                messagebox.showinfo("Updates", "✓ You're running the latest version!")
-            else:
-                # Ask user if they want to update
-                if messagebox.askyesno("Update Available", 
-                    "A new version is available!\n\n"
-                    "Would you like to download and install it?\n\n"
-                    "The app will restart after updating."):
-                    
-                    # Pull updates
-                    result = subprocess.run(['git', 'pull', 'origin', 'main'], 
-                                          cwd=app_dir, capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        messagebox.showinfo("Update Complete", 
-                            "✓ Update installed successfully!\n\n"
-                            "Please restart the app to use the new version.")
-                        self.quit()
-                    else:
-                        messagebox.showerror("Update Failed", 
-                            f"Could not install update:\n{result.stderr}")
-        
-        except FileNotFoundError:
+        # git can take seconds on a slow network, so keep it off the UI thread
+        self.update_btn.state(["disabled"])
+        self.run_in_background(lambda: fetch_update_status(app_dir),
+                               lambda result, error: self.show_update_status(app_dir, result, error))
+    
+    def show_update_status(self, app_dir, result, error):
+        """Report the result of fetch_update_status and offer to install"""
+        if error:
+            self.show_update_error(error)
+            return
+        
+        local, remote = result
+        if local == remote:
+            messagebox.showinfo("Updates", "✓ You're running the latest version!")
+        # Ask user if they want to update
+        elif messagebox.askyesno("Update Available", 
+                "A new version is available!\n\n"
+                "Would you like to download and install it?\n\n"
+                "The app will restart after updating."):
+            # Pull updates
+            self.run_in_background(
+                lambda: subprocess.run(['git', 'pull', 'origin', 'main'], 
+                                       cwd=app_dir, capture_output=True, text=True),
+                self.show_pull_result)
+            return
+        self.update_btn.state(["!disabled"])
+    
+    def show_pull_result(self, result, error):
+        if error:
+            self.show_update_error(error)
+            return
+        
+        self.update_btn.state(["!disabled"])
+        if result.returncode == 0:
+            messagebox.showinfo("Update Complete", 
+                "✓ Update installed successfully!\n\n"
+                "Please restart the app to use the new version.")
+            self.quit()
+        else:
+            messagebox.showerror("Update Failed", 
+                f"Could not install update:\n{result.stderr}")
+    
+    def show_update_error(self, error):
+        self.update_btn.state(["!disabled"])
+        if isinstance(error, FileNotFoundError):
             messagebox.showerror("Error", 
                 "Git is not installed.\n\n"
                 "Please install Xcode Command Line Tools:\n"
                 "Open Terminal and run: xcode-select --install")
-        except Exception as e:
-            messagebox.showerror("Error", f"Update check failed:\n{str(e)}")
+        else:
+            messagebox.showerror("Error", f"Update check failed:\n{str(error)}")
     
     def generate_quote_number(self):
         """Generate a quote number based on date"""
@@ -309,7 +473,8 @@ class TBGQuoteBuilder(tk.Tk):
                   font=("Helvetica", 10)).pack(side=tk.LEFT, padx=(10, 0))
         
         # Update button in top right
-        ttk.Button(header_frame, text="⟳ Check for Updates", command=self.check_for_updates).pack(side=tk.RIGHT)
+        self.update_btn = ttk.Button(header_frame, text="⟳ Check for Updates", command=self.check_for_updates)
+        self.update_btn.pack(side=tk.RIGHT)
         
         # Quote Info Section
         info_frame = ttk.LabelFrame(main_frame, text="Quote Information", padding=10)
@@ -329,6 +494,8 @@ class TBGQuoteBuilder(tk.Tk):
         
         ttk.Label(row1, text="Valid For:").pack(side=tk.LEFT)
         self.valid_days_var = tk.StringVar(value="30")
+        self.valid_days_var.trace_add('write', self.on_valid_days_change)
+        self.on_valid_days_change()
         ttk.Entry(row1, textvariable=self.valid_days_var, width=5).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Label(row1, text="days").pack(side=tk.LEFT, padx=(2, 0))
         
@@ -338,6 +505,8 @@ class TBGQuoteBuilder(tk.Tk):
         
         ttk.Label(row2, text="Estimated Duration:").pack(side=tk.LEFT)
         self.weeks_var = tk.StringVar(value="4")
+        self.weeks_var.trace_add('write', self.on_weeks_change)
+        self.on_weeks_change()
         ttk.Entry(row2, textvariable=self.weeks_var, width=5).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Label(row2, text="weeks").pack(side=tk.LEFT, padx=(2, 0))
         
@@ -393,34 +562,47 @@ class TBGQuoteBuilder(tk.Tk):
         items_frame = ttk.LabelFrame(main_frame, text="Line Items", padding=10)
         items_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Column headers
-        header_row = ttk.Frame(items_frame)
-        header_row.pack(fill=tk.X)
+        # Line items tree; cells are edited in place with a shared editor widget
+        tree_frame = ttk.Frame(items_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Label(header_row, text="Category", width=17, font=("Helvetica", 9, "bold")).grid(row=0, column=0, padx=2)
-        ttk.Label(header_row, text="Description", width=37, font=("Helvetica", 9, "bold")).grid(row=0, column=1, padx=2)
-        ttk.Label(header_row, text="Qty", width=10, font=("Helvetica", 9, "bold")).grid(row=0, column=2, padx=2)
-        ttk.Label(header_row, text="Unit", width=8, font=("Helvetica", 9, "bold")).grid(row=0, column=3, padx=2)
-        ttk.Label(header_row, text="Rate", width=12, font=("Helvetica", 9, "bold")).grid(row=0, column=4, padx=2)
-        ttk.Label(header_row, text="Amount", width=14, font=("Helvetica", 9, "bold")).grid(row=0, column=5, padx=2)
-        
-        # Scrollable line items container
-        self.items_canvas = tk.Canvas(items_frame, height=200)
-        scrollbar = ttk.Scrollbar(items_frame, orient="vertical", command=self.items_canvas.yview)
-        self.items_container = ttk.Frame(self.items_canvas)
-        
-        self.items_canvas.configure(yscrollcommand=scrollbar.set)
+        self.items_tree = ttk.Treeview(tree_frame, columns=[c[0] for c in self.ITEM_COLUMNS],
+                                       show="headings", height=10, selectmode="extended")
+        for field, heading, width, anchor in self.ITEM_COLUMNS:
+            self.items_tree.heading(field, text=heading, anchor=anchor)
+            self.items_tree.column(field, width=width, anchor=anchor,
+                                   stretch=(field == "description"))
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.scroll_items)
+        self.items_tree.configure(yscrollcommand=scrollbar.set)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.items_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        self.canvas_frame = self.items_canvas.create_window((0, 0), window=self.items_container, anchor="nw")
-        
-        self.items_container.bind("<Configure>", self.on_frame_configure)
-        self.items_canvas.bind("<Configure>", self.on_canvas_configure)
-        
-        # Add item button
-        ttk.Button(items_frame, text="+ Add Line Item", command=self.add_line_item).pack(pady=5)
+        self.items_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.items_tree.bind("<Double-1>", self.begin_edit)
+        self.items_tree.bind("<Return>", self.begin_edit)
+        self.items_tree.bind("<Delete>", lambda e: self.remove_line_item())
+        for seq in ("<ButtonPress-1>", "<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.items_tree.bind(seq, self.commit_edit, add="+")
+        
+        # Shared cell editors, placed over the cell being edited
+        self._edit_var = tk.StringVar()
+        self._cell_entry = ttk.Entry(self.items_tree, textvariable=self._edit_var)
+        self._cell_entry.bind("<Return>", self.commit_edit)
+        self._cell_entry.bind("<FocusOut>", self.commit_edit)
+        self._cell_entry.bind("<Escape>", self.cancel_edit)
+        self._cell_entry.bind("<KeyRelease>", self.on_edit_key)
+        self._cell_combo = ttk.Combobox(self.items_tree, textvariable=self._edit_var, state="readonly")
+        self._cell_combo_values = ()
+        self._cell_combo.bind("<<ComboboxSelected>>", self.commit_edit)
+        self._cell_combo.bind("<Return>", self.commit_edit)
+        self._cell_combo.bind("<Escape>", self.cancel_edit)
+        self._cell_combo.bind("<FocusOut>", lambda e: self.after_idle(self.on_combo_focus_out))
+        
+        # Add/remove item buttons
+        item_btn_row = ttk.Frame(items_frame)
+        item_btn_row.pack(pady=5)
+        ttk.Button(item_btn_row, text="+ Add Line Item", command=self.add_line_item).pack(side=tk.LEFT, padx=5)
+        ttk.Button(item_btn_row, text="− Remove Selected", command=self.remove_line_item).pack(side=tk.LEFT, padx=5)
         
         # Totals Section
         totals_frame = ttk.Frame(main_frame)
@@ -468,7 +650,8 @@ class TBGQuoteBuilder(tk.Tk):
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill=tk.X, pady=10)
         
-        ttk.Button(btn_frame, text="Generate PDF Quote", command=self.generate_pdf).pack(side=tk.LEFT, padx=5)
+        self.pdf_btn = ttk.Button(btn_frame, text="Generate PDF Quote", command=self.generate_pdf)
+        self.pdf_btn.pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Export for QuickBooks Online (CSV)", command=self.export_qbo_csv).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Export for QuickBooks Desktop (IIF)", command=self.export_qb_iif).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Clear All", command=self.clear_all).pack(side=tk.RIGHT, padx=5)
@@ -477,48 +660,181 @@ class TBGQuoteBuilder(tk.Tk):
         # Add initial line item
         self.add_line_item()
     
-    def on_frame_configure(self, event):
-        self.items_canvas.configure(scrollregion=self.items_canvas.bbox("all"))
-    
-    def on_canvas_configure(self, event):
-        self.items_canvas.itemconfig(self.canvas_frame, width=event.width)
-    
     def add_line_item(self):
         """Add a new line item row"""
-        item = LineItemFrame(self.items_container, self.categories, 
-                            self.remove_line_item, self.update_totals)
-        item.pack(fill=tk.X, pady=1)
-        self.line_items.append(item)
+        self.commit_edit()
+        row = {
+            "category": "",
+            "description": "",
+            "quantity": "1",
+            "unit": "ea",
+            "rate": "0.00",
+            "rate_value": 0.0,  # Parsed rate, kept in step with "rate"
+            "amount": 0.0
+        }
+        iid = self.items_tree.insert("", tk.END, values=self.format_line_item(row))
+        self.line_items[iid] = row
+        self.items_tree.selection_set(iid)
+        self.items_tree.focus(iid)
+        self.items_tree.see(iid)
         self.update_totals()
     
-    def remove_line_item(self, item):
-        """Remove a line item"""
-        if len(self.line_items) > 1:
-            self.line_items.remove(item)
-            item.destroy()
+    def remove_line_item(self):
+        """Remove the selected line items"""
+        self.commit_edit()
+        selected = self.items_tree.selection()
+        if not selected:
+            return
+        if len(self.line_items) > len(selected):
+            if len(selected) > 1 and not messagebox.askyesno(
+                    "Confirm", f"Remove the {len(selected)} selected line items?"):
+                return
+            for iid in selected:
+                self.line_items.pop(iid, None)
+            self.items_tree.delete(*selected)
             self.update_totals()
         else:
             messagebox.showwarning("Warning", "Must have at least one line item")
     
+    def format_line_item(self, row):
+        """Tree column values for a line item row"""
+        return (row["category"], row["description"], row["quantity"],
+                row["unit"], row["rate"], f"${row['amount']:,.2f}")
+    
+    def scroll_items(self, *args):
+        self.commit_edit()
+        self.items_tree.yview(*args)
+    
+    def begin_edit(self, event):
+        """Open the cell editor over the clicked (or focused) line item cell"""
+        self.commit_edit()
+        tree = self.items_tree
+        if event.type == tk.EventType.KeyPress:
+            iid, column = tree.focus(), "#2"
+        else:
+            iid, column = tree.identify_row(event.y), tree.identify_column(event.x)
+        if not iid or not column:
+            return "break"
+        field = self.ITEM_COLUMNS[int(column[1:]) - 1][0]
+        if field == "amount":
+            return "break"
+        bbox = tree.bbox(iid, column)
+        if not bbox:
+            return "break"
+        x, y, width, height = bbox
+        
+        if field in ("category", "unit"):
+            editor = self._cell_combo
+            values = tuple(self.categories) if field == "category" else self.UNITS
+            # Only marshal the list to Tk when it differs from what's loaded
+            if values != self._cell_combo_values:
+                editor["values"] = values
+                self._cell_combo_values = values
+        else:
+            editor = self._cell_entry
+        
+        value = self.line_items[iid][field]
+        self._edit_var.set(value)
+        self._editing = (iid, field, value)
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        if editor is self._cell_entry:
+            editor.select_range(0, tk.END)
+            editor.icursor(tk.END)
+        return "break"
+    
+    def store_edit(self, iid, field, value):
+        """Write an edited value into a line item row and its tree cell"""
+        row = self.line_items.get(iid)
+        if row is None:
+            return
+        row[field] = value
+        self.items_tree.set(iid, field, value)
+        if field == "rate":
+            row["rate_value"] = parse_rate(value)
+        if field in ("quantity", "rate"):
+            amount = calculate_amount(row["quantity"], row["rate_value"])
+            # Skip the Tk round-trip when the displayed amount hasn't changed
+            if amount != row["amount"]:
+                row["amount"] = amount
+                self.items_tree.set(iid, "amount", f"${amount:,.2f}")
+    
+    def on_edit_key(self, event):
+        """Keep totals live while typing a quantity or rate"""
+        if self._editing and self._editing[1] in ("quantity", "rate"):
+            iid, field, _ = self._editing
+            self.store_edit(iid, field, self._edit_var.get())
+            self._schedule_update()
+    
+    def on_combo_focus_out(self):
+        # The dropdown list is a child of the combobox; keep editing while it's open
+        if not str(self.tk.call("focus")).startswith(str(self._cell_combo)):
+            self.commit_edit()
+    
+    def close_editor(self):
+        editing, self._editing = self._editing, None
+        # Give focus back to the tree only if the editor still holds it (Return,
+        # Escape, selection, scrolling); after a focus-out the user has already
+        # clicked into another field, which must keep it
+        focused = str(self.tk.call("focus"))
+        if focused.startswith((str(self._cell_entry), str(self._cell_combo))):
+            self.items_tree.focus_set()
+        self._cell_entry.place_forget()
+        self._cell_combo.place_forget()
+        return editing
+    
+    def commit_edit(self, event=None):
+        """Save the open cell editor's value, if any"""
+        if not self._editing:
+            return
+        value = self._edit_var.get()
+        iid, field, _ = self.close_editor()
+        self.store_edit(iid, field, value)
+        self.update_totals()
+    
+    def cancel_edit(self, event=None):
+        """Discard the open cell editor's value, if any"""
+        if not self._editing:
+            return
+        iid, field, original = self.close_editor()
+        self.store_edit(iid, field, original)
+        self.update_totals()
+        return "break"
+    
+    def _schedule_update(self):
+        """Coalesce bursts of keystrokes into a single totals recompute"""
+        if self._pending_update:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(50, self._do_update)
+    
+    def _do_update(self):
+        self._pending_update = None
+        self.update_totals()
+    
+    def on_weeks_change(self, *args):
+        """Parse the estimated duration once per edit (at least 1 week)"""
+        try:
+            self._weeks = max(int(self.weeks_var.get() or 1), 1)
+        except ValueError:
+            self._weeks = 1
+        self._schedule_update()
+    
+    def on_valid_days_change(self, *args):
+        """Parse the quote validity period once per edit (30 days if invalid)"""
+        try:
+            self._valid_days = int(self.valid_days_var.get())
+        except ValueError:
+            self._valid_days = 30
+    
     def update_totals(self):
         """Recalculate and display totals"""
-        subtotal = sum(item.get_amount() for item in self.line_items)
-        
-        # Update each line item's amount display
-        for item in self.line_items:
-            item.update_amount_display()
+        subtotal = math.fsum(row["amount"] for row in self.line_items.values())
         
         deposit = subtotal * 0.20
         remaining = subtotal - deposit
         
-        try:
-            weeks = int(self.weeks_var.get() or 1)
-            if weeks < 1:
-                weeks = 1
-        except ValueError:
-            weeks = 1
-        
-        weekly_payment = remaining / weeks if weeks > 0 else remaining
+        weeks = self._weeks
+        weekly_payment = remaining / weeks
         
         self.subtotal_label.config(text=f"${subtotal:,.2f}")
         self.deposit_label.config(text=f"${deposit:,.2f}")
@@ -536,12 +852,17 @@ class TBGQuoteBuilder(tk.Tk):
             ]
         )
         
+        seen = set(self.attachments)
+        new_files = []
         for filepath in files:
-            if filepath not in self.attachments:
-                self.attachments.append(filepath)
-                # Show just the filename in the listbox
-                filename = os.path.basename(filepath)
-                self.attachments_listbox.insert(tk.END, filename)
+            if filepath not in seen:
+                seen.add(filepath)
+                new_files.append(filepath)
+        
+        if new_files:
+            self.attachments.extend(new_files)
+            # Show just the filenames in the listbox, inserted in one Tk call
+            self.attachments_listbox.insert(tk.END, *(os.path.basename(f) for f in new_files))
     
     def clear_attachments(self):
         """Clear all attachments"""
@@ -573,8 +894,7 @@ class TBGQuoteBuilder(tk.Tk):
         scrollbar.config(command=cat_listbox.yview)
         
         # Populate listbox
-        for cat in self.categories:
-            cat_listbox.insert(tk.END, cat)
+        cat_listbox.insert(tk.END, *self.categories)
         
         # Entry for new category
         entry_frame = ttk.Frame(dialog)
@@ -643,8 +963,7 @@ class TBGQuoteBuilder(tk.Tk):
             if messagebox.askyesno("Confirm", "Reset to default categories?", parent=dialog):
                 self.categories = self.DEFAULT_CATEGORIES.copy()
                 cat_listbox.delete(0, tk.END)
-                for cat in self.categories:
-                    cat_listbox.insert(tk.END, cat)
+                cat_listbox.insert(tk.END, *self.categories)
         
         ttk.Button(action_frame, text="↑ Move Up", command=move_up).pack(side=tk.LEFT, padx=2)
         ttk.Button(action_frame, text="↓ Move Down", command=move_down).pack(side=tk.LEFT, padx=2)
@@ -657,12 +976,6 @@ class TBGQuoteBuilder(tk.Tk):
         
         def save_and_close():
             self.save_categories()
-            # Update all existing line item dropdowns
-            for item in self.line_items:
-                current_val = item.category_var.get()
-                item.category_combo['values'] = self.categories
-                if current_val in self.categories:
-                    item.category_var.set(current_val)
             dialog.destroy()
             messagebox.showinfo("Saved", "Categories saved! New line items will use updated categories.")
         
@@ -674,23 +987,26 @@ class TBGQuoteBuilder(tk.Tk):
         ttk.Button(bottom_frame, text="Save & Close", command=save_and_close).pack(side=tk.RIGHT, padx=5)
         ttk.Button(bottom_frame, text="Cancel", command=cancel).pack(side=tk.RIGHT, padx=5)
     
+    def iter_line_items(self):
+        """Yield a copy of each line item that has a description"""
+        for row in self.line_items.values():
+            if row["description"]:
+                yield dict(row)
+    
     def get_quote_data(self):
         """Collect all quote data"""
-        subtotal = sum(item.get_amount() for item in self.line_items)
+        self.commit_edit()
+        subtotal = math.fsum(row["amount"] for row in self.line_items.values())
         deposit = subtotal * 0.20
         remaining = subtotal - deposit
         
-        try:
-            weeks = int(self.weeks_var.get() or 1)
-        except ValueError:
-            weeks = 1
-        
-        weekly_payment = remaining / weeks if weeks > 0 else remaining
+        weeks = self._weeks
+        weekly_payment = remaining / weeks
         
         return {
             "quote_number": self.quote_num_var.get(),
             "date": self.date_var.get(),
-            "valid_days": self.valid_days_var.get(),
+            "valid_days": self._valid_days,
             "weeks": weeks,
             "customer": {
                 "name": self.cust_name_var.get(),
@@ -702,7 +1018,7 @@ class TBGQuoteBuilder(tk.Tk):
                 "email": self.email_var.get()
             },
             "project_description": self.project_desc.get("1.0", tk.END).strip(),
-            "line_items": [item.get_data() for item in self.line_items if item.get_data()["description"]],
+            "line_items": list(self.iter_line_items()),
             "subtotal": subtotal,
             "deposit": deposit,
             "remaining": remaining,
@@ -733,14 +1049,26 @@ class TBGQuoteBuilder(tk.Tk):
         if not filename:
             return
         
+        # Building can take seconds with attachments; data is a snapshot, so
+        # the worker never touches Tk
+        self.pdf_btn.state(["disabled"])
+        self.run_in_background(lambda: create_pdf_quote(data, filename),
+                               lambda result, error: self.show_pdf_result(filename, error))
+    
+    def show_pdf_result(self, filename, error):
+        """Report the result of a background create_pdf_quote and open the PDF"""
+        self.pdf_btn.state(["!disabled"])
+        if error:
+            messagebox.showerror("Error", f"Failed to create PDF: {str(error)}")
+            return
+        
+        messagebox.showinfo("Success", f"Quote saved to:\n{filename}")
+        
+        # Open the PDF
         try:
-            create_pdf_quote(data, filename)
-            messagebox.showinfo("Success", f"Quote saved to:\n{filename}")
-            
-            # Open the PDF
-            os.system(f'open "{filename}"')
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create PDF: {str(e)}")
+            open_file(filename)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not open PDF: {str(e)}")
     
     def export_qbo_csv(self):
         """Export estimate for QuickBooks Online import"""
@@ -813,16 +1141,11 @@ class TBGQuoteBuilder(tk.Tk):
             self.project_desc.delete("1.0", tk.END)
             self.weeks_var.set("4")
             
-            # Remove all line items except one
-            for item in self.line_items[1:]:
-                item.destroy()
-            self.line_items = self.line_items[:1]
-            
-            # Clear the remaining item
-            self.line_items[0].category_var.set("")
-            self.line_items[0].desc_var.set("")
-            self.line_items[0].qty_var.set("1")
-            self.line_items[0].rate_var.set("0.00")
+            # Remove all line items and start again with an empty one
+            self.commit_edit()
+            self.items_tree.delete(*self.line_items)
+            self.line_items = {}
+            self.add_line_item()
             
             # Clear attachments
             self.clear_attachments()
@@ -832,7 +1155,10 @@ class TBGQuoteBuilder(tk.Tk):
 
 def create_pdf_quote(data, filename):
     """Create a professional PDF quote with TBG branding"""
-    from reportlab.platypus import Flowable
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import Flowable, SimpleDocTemplate, Paragraph, Spacer, Table, Image
     
     class TBGLogoFlowable(Flowable):
         """TBG Logo as a Flowable"""
@@ -842,35 +1168,22 @@ def create_pdf_quote(data, filename):
             self.height = height
         
         def draw(self):
-            # Red roof/chevron
-            roof_width = 56
-            roof_height = 14
-            roof_x = (self.width - roof_width) / 2
-            roof_y = self.height - roof_height - 2
-            
-            self.canv.setFillColor(TBG_RED)
-            self.canv.setStrokeColor(TBG_RED)
-            
-            path = self.canv.beginPath()
-            path.moveTo(roof_x, roof_y)
-            path.lineTo(roof_x + roof_width/2, roof_y + roof_height)
-            path.lineTo(roof_x + roof_width, roof_y)
-            path.lineTo(roof_x + roof_width - 6, roof_y)
-            path.lineTo(roof_x + roof_width/2, roof_y + roof_height - 6)
-            path.lineTo(roof_x + 6, roof_y)
-            path.close()
-            self.canv.drawPath(path, fill=1, stroke=0)
-            
-            self.canv.setFillColor(TBG_BLACK)
-            self.canv.setFont("Helvetica-Bold", 24)
-            self.canv.drawCentredString(self.width/2, self.height - 38, "TBG")
-            
-            self.canv.setFillColor(TBG_RED)
-            self.canv.setFont("Helvetica", 10)
-            self.canv.drawCentredString(self.width/2, self.height - 50, "enterprises")
+            TBGLogo(self.width, self.height).draw_form(self.canv)
     
+    class PageMarker(Flowable):
+        """Zero-size flowable that records the page number it lands on"""
+        page = None
+        
+        def wrap(self, availWidth, availHeight):
+            return (0, 0)
+        
+        def draw(self):
+            self.page = self.canv.getPageNumber()
+    
+    # Built in memory so attached PDFs can be merged in before saving
+    buffer = io.BytesIO()
     doc = SimpleDocTemplate(
-        filename,
+        buffer,
         pagesize=letter,
         rightMargin=0.5*inch,
         leftMargin=0.5*inch,
@@ -878,68 +1191,15 @@ def create_pdf_quote(data, filename):
         bottomMargin=0.5*inch
     )
     
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    styles.add(ParagraphStyle(
-        name='CompanyAddress',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=TBG_GRAY,
-        alignment=TA_LEFT,
-        spaceAfter=0
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='CompanyName',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=TBG_RED,
-        spaceAfter=2,
-        alignment=TA_LEFT
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='QuoteTitle',
-        parent=styles['Heading2'],
-        fontSize=18,
-        textColor=TBG_BLACK,
-        spaceAfter=20,
-        alignment=TA_LEFT
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading3'],
-        fontSize=11,
-        textColor=TBG_RED,
-        spaceBefore=15,
-        spaceAfter=5,
-        fontName='Helvetica-Bold'
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='TBGBody',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=TBG_GRAY,
-        spaceAfter=3
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SmallText',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=TBG_GRAY
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='QuoteNumber',
-        parent=styles['Normal'],
-        fontSize=16,
-        textColor=TBG_BLACK,
-        alignment=TA_RIGHT
-    ))
+    pdf_styles = get_pdf_styles()
+    styles = pdf_styles.paragraph
+    
+    def small_cell(text, width):
+        """Plain string cell for short text without markup, skipping Paragraph parsing"""
+        text = text.strip()
+        if '<' in text or '&' in text or stringWidth(text, 'Helvetica', 8) > width:
+            return Paragraph(text, styles['SmallText'])
+        return text
     
     story = []
     
@@ -953,24 +1213,21 @@ def create_pdf_quote(data, filename):
     ]
     
     header_table = Table(header_data, colWidths=[4*inch, 3*inch])
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-    ]))
-    story.append(header_table)
-    
-    # Company contact info
-    story.append(Paragraph(f"{COMPANY_ADDRESS}  |  {COMPANY_PHONE}  |  {COMPANY_EMAIL}", styles['CompanyAddress']))
+    header_table.setStyle(pdf_styles.header_table)
     
     # Red line separator
-    story.append(Spacer(1, 8))
     separator_data = [[""]]
     separator = Table(separator_data, colWidths=[7.5*inch])
-    separator.setStyle(TableStyle([
-        ('LINEABOVE', (0, 0), (-1, 0), 3, TBG_RED),
-    ]))
-    story.append(separator)
-    story.append(Spacer(1, 15))
+    separator.setStyle(pdf_styles.separator_table)
+    
+    story.extend([
+        header_table,
+        # Company contact info
+        Paragraph(f"{COMPANY_ADDRESS}  |  {COMPANY_PHONE}  |  {COMPANY_EMAIL}", styles['CompanyAddress']),
+        Spacer(1, 8),
+        separator,
+        Spacer(1, 15),
+    ])
     
     # Quote details and customer info side by side
     quote_details = f"""
@@ -995,59 +1252,44 @@ def create_pdf_quote(data, filename):
     ]
     
     info_table = Table(info_data, colWidths=[3.5*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(info_table)
-    story.append(Spacer(1, 15))
+    info_table.setStyle(pdf_styles.info_table)
+    story.extend([info_table, Spacer(1, 15)])
     
     # Project Description
     if data['project_description']:
-        story.append(Paragraph("PROJECT DESCRIPTION", styles['SectionHeader']))
-        story.append(Paragraph(data['project_description'], styles['TBGBody']))
-        story.append(Spacer(1, 10))
+        story.extend([
+            Paragraph("PROJECT DESCRIPTION", styles['SectionHeader']),
+            Paragraph(data['project_description'], styles['TBGBody']),
+            Spacer(1, 10),
+        ])
     
     # Line Items Table
     story.append(Paragraph("SCOPE OF WORK", styles['SectionHeader']))
     
     # Table header
-    table_data = [
-        [Paragraph("<b>Category</b>", styles['SmallText']),
-         Paragraph("<b>Description</b>", styles['SmallText']),
-         Paragraph("<b>Qty</b>", styles['SmallText']),
-         Paragraph("<b>Unit</b>", styles['SmallText']),
-         Paragraph("<b>Rate</b>", styles['SmallText']),
-         Paragraph("<b>Amount</b>", styles['SmallText'])]
-    ]
+    table_data = [pdf_styles.items_header_row]
     
-    # Line items
+    # Line items (Qty and Unit fit a narrow column less its 6pt side paddings)
+    narrow_width = pdf_styles.item_col_widths[2] - 12
     for item in data['line_items']:
         table_data.append([
             Paragraph(item['category'], styles['SmallText']),
             Paragraph(item['description'], styles['SmallText']),
-            Paragraph(str(item['quantity']), styles['SmallText']),
-            Paragraph(item['unit'], styles['SmallText']),
-            Paragraph(f"${float(item['rate'] or 0):,.2f}", styles['SmallText']),
+            small_cell(str(item['quantity']), narrow_width),
+            small_cell(item['unit'], narrow_width),
+            Paragraph(f"${item['rate_value']:,.2f}", styles['SmallText']),
             Paragraph(f"${item['amount']:,.2f}", styles['SmallText'])
         ])
     
-    items_table = Table(table_data, colWidths=[1*inch, 2.8*inch, 0.5*inch, 0.5*inch, 0.9*inch, 0.9*inch])
-    items_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TBG_BLACK),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('TOPPADDING', (0, 0), (-1, 0), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, TBG_LIGHT_GRAY]),
-        ('GRID', (0, 0), (-1, -1), 0.5, TBG_GRAY),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 1), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-    ]))
-    story.append(items_table)
+    header_row, item_rows = table_data[0], table_data[1:]
+    for start in range(0, max(len(item_rows), 1), PDF_TABLE_CHUNK_ROWS):
+        if start:
+            story.append(Spacer(1, 0))
+        items_table = Table([header_row] + item_rows[start:start + PDF_TABLE_CHUNK_ROWS],
+                            colWidths=pdf_styles.item_col_widths,
+                            repeatRows=1)
+        items_table.setStyle(pdf_styles.items_table)
+        story.append(items_table)
     story.append(Spacer(1, 15))
     
     # Totals
@@ -1056,229 +1298,283 @@ def create_pdf_quote(data, filename):
          Paragraph(f"<b>${data['subtotal']:,.2f}</b>", styles['TBGBody'])],
     ]
     
-    totals_table = Table(totals_data, colWidths=[1*inch, 2.8*inch, 0.5*inch, 0.5*inch, 0.9*inch, 0.9*inch])
-    totals_table.setStyle(TableStyle([
-        ('ALIGN', (4, 0), (-1, -1), 'RIGHT'),
-        ('LINEABOVE', (4, 0), (-1, 0), 1, TBG_BLACK),
-    ]))
-    story.append(totals_table)
-    story.append(Spacer(1, 20))
+    totals_table = Table(totals_data, colWidths=pdf_styles.item_col_widths)
+    totals_table.setStyle(pdf_styles.totals_table)
+    story.extend([totals_table, Spacer(1, 20)])
     
     # Payment Schedule
     story.append(Paragraph("PAYMENT SCHEDULE", styles['SectionHeader']))
     
     payment_data = [
-        [Paragraph("<b>Payment</b>", styles['SmallText']),
-         Paragraph("<b>When</b>", styles['SmallText']),
-         Paragraph("<b>Amount</b>", styles['SmallText'])],
-        [Paragraph("Deposit (20%)", styles['SmallText']),
-         Paragraph("Upon acceptance", styles['SmallText']),
-         Paragraph(f"${data['deposit']:,.2f}", styles['SmallText'])],
+        pdf_styles.payment_header_row,
+        pdf_styles.deposit_labels + [Paragraph(f"${data['deposit']:,.2f}", styles['SmallText'])],
     ]
     
     # Add weekly payments
     for week in range(1, data['weeks'] + 1):
         payment_data.append([
-            Paragraph(f"Payment {week}", styles['SmallText']),
-            Paragraph(f"Week {week}", styles['SmallText']),
+            f"Payment {week}",
+            f"Week {week}",
             Paragraph(f"${data['weekly_payment']:,.2f}", styles['SmallText'])
         ])
     
     # Total row
     payment_data.append([
         Paragraph("<b>TOTAL</b>", styles['SmallText']),
-        Paragraph("", styles['SmallText']),
+        "",
         Paragraph(f"<b>${data['subtotal']:,.2f}</b>", styles['SmallText'])
     ])
     
     payment_table = Table(payment_data, colWidths=[2*inch, 2.5*inch, 1.5*inch])
-    payment_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TBG_BLACK),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, TBG_GRAY),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [white, TBG_LIGHT_GRAY]),
-        ('BACKGROUND', (0, -1), (-1, -1), TBG_LIGHT_GRAY),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    story.append(payment_table)
-    story.append(Spacer(1, 20))
+    payment_table.setStyle(pdf_styles.payment_table)
+    story.extend([payment_table, Spacer(1, 20)])
     
     # Notes/Terms
     if data['notes']:
         story.append(Paragraph("TERMS & CONDITIONS", styles['SectionHeader']))
-        for line in data['notes'].split('\n'):
-            if line.strip():
-                story.append(Paragraph(line, styles['SmallText']))
+        story.extend(Paragraph(line, styles['SmallText'])
+                     for line in data['notes'].split('\n') if line.strip())
         story.append(Spacer(1, 20))
     
     # Signature section
-    story.append(Spacer(1, 30))
-    
-    sig_data = [
-        [Paragraph("ACCEPTED BY:", styles['TBGBody']), "", 
-         Paragraph("TBG ENTERPRISES:", styles['TBGBody']), ""],
-        ["_" * 35, "", "_" * 35, ""],
-        [Paragraph("Customer Signature", styles['SmallText']), 
-         Paragraph("Date", styles['SmallText']),
-         Paragraph("Authorized Signature", styles['SmallText']),
-         Paragraph("Date", styles['SmallText'])],
-    ]
-    
-    sig_table = Table(sig_data, colWidths=[2.5*inch, 1*inch, 2.5*inch, 1*inch])
-    sig_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
-        ('TOPPADDING', (0, 1), (-1, 1), 30),
-    ]))
-    story.append(sig_table)
+    sig_table = Table(pdf_styles.signature_rows, colWidths=[2.5*inch, 1*inch, 2.5*inch, 1*inch])
+    sig_table.setStyle(pdf_styles.signature_table)
+    story.extend([Spacer(1, 30), sig_table])
     
     # Attachments (Plans, Images) - on new pages
     attachments = data.get('attachments', [])
+    pdf_attachments = []  # (fitz document, PageMarker) pairs to merge after the build
     if attachments:
         from reportlab.platypus import PageBreak
-        from PIL import Image as PILImage
         import fitz  # PyMuPDF for PDF handling
         
-        story.append(PageBreak())
-        story.append(Paragraph("ATTACHED PLANS & DOCUMENTS", styles['SectionHeader']))
-        story.append(Spacer(1, 10))
+        story.extend([
+            PageBreak(),
+            Paragraph("ATTACHED PLANS & DOCUMENTS", styles['SectionHeader']),
+            Spacer(1, 10),
+        ])
         
-        for i, filepath in enumerate(attachments):
-            filename = os.path.basename(filepath)
-            ext = os.path.splitext(filepath)[1].lower()
+        # Images are scaled to fit the page (max 7" wide, 9" tall)
+        max_width = 7 * inch
+        max_height = 9 * inch
+        
+        # Resolve each file once, dropping repeats of the same file
+        seen = set()
+        entries = []
+        for filepath in attachments:
+            real_path = os.path.realpath(filepath)
+            if real_path in seen:
+                continue
+            seen.add(real_path)
+            entries.append((real_path, os.path.basename(filepath),
+                            os.path.splitext(real_path)[1].lower()))
+        
+        for i, (filepath, attach_name, ext) in enumerate(entries):
+            story.extend([
+                Paragraph(f"<b>Attachment {i+1}:</b> {attach_name}", styles['SmallText']),
+                Spacer(1, 5),
+            ])
             
-            story.append(Paragraph(f"<b>Attachment {i+1}:</b> {filename}", styles['SmallText']))
-            story.append(Spacer(1, 5))
+            if not os.path.isfile(filepath):
+                story.extend([
+                    Paragraph("<i>Could not embed attachment: file not found</i>", styles['SmallText']),
+                    Spacer(1, 10),
+                ])
+                continue
             
             try:
                 if ext in ['.jpg', '.jpeg', '.png']:
-                    # Handle images
-                    with PILImage.open(filepath) as pil_img:
-                        img_width, img_height = pil_img.size
-                    
-                    # Scale to fit page (max 7" wide, 9" tall)
-                    max_width = 7 * inch
-                    max_height = 9 * inch
+                    # Handle images - the flowable reads the size from the
+                    # header and keeps the same reader for embedding
+                    img = Image(filepath)
+                    img_width, img_height = img.imageWidth, img.imageHeight
                     
                     scale = min(max_width / img_width, max_height / img_height, 1.0)
-                    display_width = img_width * scale
-                    display_height = img_height * scale
-                    
-                    img = Image(filepath, width=display_width, height=display_height)
-                    story.append(img)
-                    story.append(Spacer(1, 20))
+                    img.drawWidth = img_width * scale
+                    img.drawHeight = img_height * scale
+                    story.extend([img, Spacer(1, 20)])
                     
                 elif ext == '.pdf':
-                    # Handle PDFs - convert pages to images
+                    # Handle PDFs - their pages are merged in as-is (vector,
+                    # not rasterized) right after this label once the body is built
                     pdf_doc = fitz.open(filepath)
-                    for page_num in range(len(pdf_doc)):
-                        page = pdf_doc[page_num]
-                        # Render at 150 DPI for good quality
-                        mat = fitz.Matrix(150/72, 150/72)
-                        pix = page.get_pixmap(matrix=mat)
-                        
-                        # Save to temp file
-                        import tempfile
-                        temp_img = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                        pix.save(temp_img.name)
-                        
-                        # Scale to fit page
-                        max_width = 7 * inch
-                        max_height = 9 * inch
-                        
-                        scale = min(max_width / pix.width, max_height / pix.height, 1.0)
-                        display_width = pix.width * scale
-                        display_height = pix.height * scale
-                        
-                        img = Image(temp_img.name, width=display_width, height=display_height)
-                        
-                        if page_num > 0:
-                            story.append(Paragraph(f"<i>(Page {page_num + 1} of {filename})</i>", styles['SmallText']))
-                        
-                        story.append(img)
-                        story.append(Spacer(1, 10))
-                        
-                        # Clean up temp file
-                        temp_img.close()
-                        os.unlink(temp_img.name)
+                    if pdf_doc.needs_pass:
+                        pdf_doc.close()
+                        raise ValueError("the PDF is password protected")
+                    if not pdf_doc.is_pdf:
+                        # fitz also opens images, XPS, EPUB etc.; insert_pdf
+                        # only takes real PDFs, so convert those first
+                        try:
+                            pdf_bytes = pdf_doc.convert_to_pdf()
+                        finally:
+                            pdf_doc.close()
+                        pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
                     
-                    pdf_doc.close()
-                    story.append(Spacer(1, 20))
+                    marker = PageMarker()
+                    pdf_attachments.append((pdf_doc, marker))
+                    
+                    pages = len(pdf_doc)
+                    story.extend([
+                        Paragraph(
+                            f"<i>(Attached on the following {pages} page{'s' if pages != 1 else ''})</i>",
+                            styles['SmallText']),
+                        marker,
+                        PageBreak(),
+                    ])
                     
             except Exception as e:
-                story.append(Paragraph(f"<i>Could not embed attachment: {str(e)}</i>", styles['SmallText']))
-                story.append(Spacer(1, 10))
+                story.extend([
+                    Paragraph(f"<i>Could not embed attachment: {str(e)}</i>", styles['SmallText']),
+                    Spacer(1, 10),
+                ])
     
-    # Build PDF
-    doc.build(story)
+    try:
+        # Build PDF
+        doc.build(story)
+        
+        if not pdf_attachments:
+            with open(filename, 'wb') as f:
+                f.write(buffer.getvalue())
+            return
+        
+        # Insert each attached PDF after its label page, last first so the
+        # recorded page numbers of earlier attachments stay valid
+        with fitz.open(stream=buffer.getvalue(), filetype="pdf") as out:
+            for pdf_doc, marker in reversed(pdf_attachments):
+                out.insert_pdf(pdf_doc, start_at=marker.page)
+            out.save(filename, deflate=True)
+    finally:
+        for pdf_doc, _ in pdf_attachments:
+            pdf_doc.close()
+
+
+def open_file(path):
+    """Open a file in its default application without blocking or using a shell"""
+    if sys.platform == "darwin":
+        subprocess.Popen(['open', path])
+    elif sys.platform == "win32":
+        os.startfile(path)
+    else:
+        subprocess.Popen(['xdg-open', path])
+
+
+def fetch_update_status(app_dir):
+    """Fetch origin/main and return the (local, remote) commit hashes"""
+    subprocess.run(['git', 'fetch', 'origin', 'main'], 
+                   cwd=app_dir, capture_output=True, check=True)
+    
+    # Both hashes from a single rev-parse
+    hashes = subprocess.run(['git', 'rev-parse', 'HEAD', 'origin/main'], 
+                            cwd=app_dir, capture_output=True, text=True, check=True)
+    local, remote = hashes.stdout.split()
+    return local, remote
+
+
+def parse_rate(rate):
+    """Parse a rate like "$1,250.00", treating blank or invalid input as 0"""
+    try:
+        return float(rate.translate(_RATE_STRIP) or 0)
+    except ValueError:
+        return 0.0
+
+
+def calculate_amount(quantity, rate_value):
+    """Calculate a line item amount from its quantity and parsed rate"""
+    try:
+        return float(quantity or 0) * rate_value
+    except ValueError:
+        return 0
 
 
 def calculate_valid_date(date_str, days):
     """Calculate expiration date"""
+    try:
+        days = int(days)
+    except (TypeError, ValueError):
+        return "30 days from date"
+    return _valid_date(date_str, days)
+
+
+@functools.lru_cache(maxsize=128)
+def _valid_date(date_str, days):
+    """Cached worker for calculate_valid_date, keyed on the normalized day count"""
     try:
         date = datetime.strptime(date_str, "%m/%d/%Y")
-        valid_until = date + timedelta(days=int(days))
+        valid_until = date + timedelta(days=days)
         return valid_until.strftime("%m/%d/%Y")
-    except:
+    except (ValueError, OverflowError):
         return "30 days from date"
 
 
 def create_qbo_csv(data, filename):
     """Create CSV for QuickBooks Online import"""
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Header row for QBO estimate import
-        writer.writerow([
-            'Customer',
-            'EstimateNumber',
-            'EstimateDate',
-            'ExpirationDate',
-            'ItemDescription',
-            'ItemQuantity',
-            'ItemRate',
-            'ItemAmount',
-            'Memo'
-        ])
-        
-        valid_date = calculate_valid_date(data['date'], data['valid_days'])
-        
-        # Write each line item as a row
-        for i, item in enumerate(data['line_items']):
-            writer.writerow([
-                data['customer']['name'],
-                data['quote_number'],
-                data['date'],
-                valid_date,
-                f"{item['category']}: {item['description']}",
-                item['quantity'],
-                float(item['rate'] or 0),
-                item['amount'],
-                data['project_description'] if i == 0 else ""
-            ])
+    # Header row for QBO estimate import
+    rows = [[
+        'Customer',
+        'EstimateNumber',
+        'EstimateDate',
+        'ExpirationDate',
+        'ItemDescription',
+        'ItemQuantity',
+        'ItemRate',
+        'ItemAmount',
+        'Memo'
+    ]]
+    
+    customer = data['customer']['name']
+    quote_number = data['quote_number']
+    date = data['date']
+    valid_date = calculate_valid_date(date, data['valid_days'])
+    
+    # One row per line item
+    rows.extend(
+        [
+            customer,
+            quote_number,
+            date,
+            valid_date,
+            f"{item['category']}: {item['description']}",
+            item['quantity'],
+            item['rate_value'],
+            item['amount'],
+            data['project_description'] if i == 0 else ""
+        ]
+        for i, item in enumerate(data['line_items'])
+    )
+    
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+        csv.writer(f).writerows(rows)
 
 
 def create_qb_iif(data, filename):
     """Create IIF file for QuickBooks Desktop import"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        # IIF Header for estimates
-        f.write("!TRNS\tTRNSTYPE\tDATE\tACCNT\tNAME\tCLASS\tAMOUNT\tDOCNUM\tMEMO\n")
-        f.write("!SPL\tTRNSTYPE\tDATE\tACCNT\tNAME\tAMOUNT\tDOCNUM\tMEMO\tQNTY\tPRICE\n")
-        f.write("!ENDTRNS\n")
-        
-        # Format date for IIF (MM/DD/YYYY)
-        trns_date = data['date']
-        
-        # Main transaction line
-        f.write(f"TRNS\tESTIMATE\t{trns_date}\tAccounts Receivable\t{data['customer']['name']}\t\t{data['subtotal']:.2f}\t{data['quote_number']}\t{data['project_description'][:50] if data['project_description'] else ''}\n")
-        
-        # Split lines for each item
-        for item in data['line_items']:
-            item_desc = f"{item['category']}: {item['description']}"
-            f.write(f"SPL\tESTIMATE\t{trns_date}\tServices\t{data['customer']['name']}\t-{item['amount']:.2f}\t{data['quote_number']}\t{item_desc[:50]}\t{item['quantity']}\t{float(item['rate'] or 0):.2f}\n")
-        
-        f.write("ENDTRNS\n")
+    # Format date for IIF (MM/DD/YYYY)
+    trns_date = data['date']
+    customer = data['customer']['name']
+    quote_number = data['quote_number']
+    
+    # Main transaction line
+    lines = [
+        "TRNS\tESTIMATE\t%s\tAccounts Receivable\t%s\t\t%.2f\t%s\t%s" % (
+            trns_date, customer, data['subtotal'], quote_number,
+            (data['project_description'] or '')[:50])
+    ]
+    
+    # Split lines for each item
+    lines.extend(
+        "SPL\tESTIMATE\t%s\tServices\t%s\t-%.2f\t%s\t%s\t%s\t%.2f" % (
+            trns_date, customer, item['amount'], quote_number,
+            f"{item['category']}: {item['description']}"[:50],
+            item['quantity'], item['rate_value'])
+        for item in data['line_items']
+    )
+    
+    lines.append("ENDTRNS")
+    
+    # Encoded once and written in a single call, header included
+    body = os.linesep.join(lines).encode('utf-8')
+    with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(IIF_HEADER + body + IIF_NEWLINE)
 
 
 if __name__ == "__main__":